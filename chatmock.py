@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import argparse
 import asyncio
-import base64
+import binascii
 import concurrent.futures
 import json
 import os
@@ -12,10 +12,9 @@ import sys
 import tempfile
 import threading
 import time
-import urllib.parse
 import urllib.request
 import uuid
-from collections import deque
+import itertools
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional, Tuple
 
@@ -23,12 +22,33 @@ from flask import Flask, Response, g, jsonify, make_response, request
 from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 from playwright.async_api import async_playwright
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _json_loads(data: Any) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_response(obj: Any, status: int = 200) -> Response:
+    if orjson is not None:
+        return Response(orjson.dumps(obj), status=status, mimetype="application/json")
+    return Response(json.dumps(obj), status=status, mimetype="application/json")
+
 
 CHAT_URL_DEFAULT = "https://chatgpt.com/"
 DEFAULT_MODEL = "gpt-5-high"
 TIMEOUT_SECONDS = 600.0
 PROMPT_CLIPBOARD_THRESHOLD = 1000
 WATCHDOG_INTERVAL_SECONDS = 10.0
+WATCHDOG_PROBE_TIMEOUT_SECONDS = 4.0
+FINAL_STABLE_SECONDS = 3.0
+PAGE_POOL_SIZE_DEFAULT = 4
+TRAFFIC_BODY_LOG_MAX_BYTES = 65536
 
 BLOCKED_RESOURCE_TYPES = {"image", "media", "font"}
 BLOCKED_DOMAINS = {
@@ -40,6 +60,27 @@ BLOCKED_DOMAINS = {
     "hotjar.com",
 }
 RATE_LIMIT_MARKERS = ("rate limit", "too many requests", "try again later", "temporarily blocked")
+# Patterns installed once per page via CDP Network.setBlockedURLs so blocking
+# happens inside Chromium's network stack instead of a Python callback per
+# subresource. Extension globs stand in for the image/media/font resource
+# types, which pattern blocking cannot express directly.
+CDP_BLOCKED_URL_PATTERNS = (
+    [f"*://{d}/*" for d in sorted(BLOCKED_DOMAINS)]
+    + [f"*://*.{d}/*" for d in sorted(BLOCKED_DOMAINS)]
+    + [
+        "*.png", "*.jpg", "*.jpeg", "*.webp", "*.gif", "*.ico",
+        "*.mp4", "*.webm", "*.mp3",
+        "*.woff", "*.woff2", "*.ttf", "*.otf",
+    ]
+)
+# Common data-URL headers resolve via dict lookup; the compiled regex only
+# runs for unusual image subtypes.
+DATA_URL_MIME_BY_HEADER = {
+    "data:image/png;base64": "image/png",
+    "data:image/jpeg;base64": "image/jpeg",
+    "data:image/webp;base64": "image/webp",
+}
+DATA_URL_HEADER_RE = re.compile(r"data:(image/[a-zA-Z0-9.+-]+);base64")
 CHALLENGE_MARKERS = ("just a moment", "verify you are human", "checking your browser", "cf-challenge")
 
 TEXTAREA_SELECTORS = [
@@ -84,6 +125,147 @@ UPLOAD_READY_SELECTORS = [
     "[data-testid*='attachment']",
     "[data-testid*='upload']",
 ]
+# Selectors whose Locator objects are cached per page; hot loops reuse them
+# instead of re-crossing the Playwright boundary on every poll.
+CACHED_SELECTORS = list(
+    dict.fromkeys(
+        TEXTAREA_SELECTORS
+        + EDITABLE_SELECTORS
+        + SEND_BUTTON_SELECTORS
+        + THINKING_SELECTORS
+        + UPLOAD_READY_SELECTORS
+        + ["input[type='file']"]
+    )
+)
+# `:visible` is only valid for CSS selectors, so the visible cache skips
+# engine-prefixed entries such as "text=Thinking".
+VISIBLE_CACHED_SELECTORS = list(dict.fromkeys(TEXTAREA_SELECTORS + EDITABLE_SELECTORS))
+
+# In-browser visibility scan: one evaluate replaces count()+is_visible()
+# round-trips per selector. "text=" entries fall back to an innerText scan.
+ANY_VISIBLE_JS = """
+(sels) => {
+  const isVisible = (el) => {
+    if (!el) return false;
+    const r = el.getBoundingClientRect();
+    const cs = window.getComputedStyle(el);
+    return !!cs && cs.display !== "none" && cs.visibility !== "hidden" && r.width > 0 && r.height > 0;
+  };
+  for (const s of sels) {
+    if (s.startsWith("text=")) {
+      const body = (document.body && document.body.innerText) ? document.body.innerText : "";
+      if (body.includes(s.slice(5))) return true;
+      continue;
+    }
+    let nodes;
+    try { nodes = document.querySelectorAll(s); } catch (_) { continue; }
+    for (const el of nodes) if (isVisible(el)) return true;
+  }
+  return false;
+}
+"""
+
+# Single probe for _wait_for_ready_composer: title, body preview, composer
+# visibility, and challenge markers in one round-trip.
+READY_PROBE_JS = """
+({ composer, challenge }) => {
+  const title = document.title || "";
+  const body = (document.body && document.body.innerText) ? document.body.innerText : "";
+  const low = (title + "\\n" + body).toLowerCase();
+  let challengeHit = false;
+  for (const m of challenge) if (low.indexOf(m) >= 0) { challengeHit = true; break; }
+  const result = { title, preview: body.slice(0, 220), hasComposer: false, challenge: challengeHit };
+  if (challengeHit) return result;
+  const isVisible = (el) => {
+    if (!el) return false;
+    const r = el.getBoundingClientRect();
+    const cs = window.getComputedStyle(el);
+    return !!cs && cs.display !== "none" && cs.visibility !== "hidden" && r.width > 0 && r.height > 0;
+  };
+  for (const s of composer) {
+    let nodes;
+    try { nodes = document.querySelectorAll(s); } catch (_) { continue; }
+    for (const el of nodes) if (isVisible(el)) { result.hasComposer = true; break; }
+    if (result.hasComposer) break;
+  }
+  return result;
+}
+"""
+
+# Fused poll for _wait_for_final: latest assistant message, thinking-spinner
+# visibility, and a djb2 hash of the candidate content in one evaluate, so the
+# stability check compares hashes instead of re-transferring full strings.
+FINAL_STATE_JS = """
+({ msg, md, thinking }) => {
+  const isVisible = (el) => {
+    if (!el) return false;
+    const r = el.getBoundingClientRect();
+    const cs = window.getComputedStyle(el);
+    return !!cs && cs.display !== "none" && cs.visibility !== "hidden" && r.width > 0 && r.height > 0;
+  };
+  let thinkingVisible = false;
+  for (const s of thinking) {
+    if (s.startsWith("text=")) {
+      const body = (document.body && document.body.innerText) ? document.body.innerText : "";
+      if (body.includes(s.slice(5))) { thinkingVisible = true; break; }
+      continue;
+    }
+    let nodes;
+    try { nodes = document.querySelectorAll(s); } catch (_) { continue; }
+    for (const el of nodes) if (isVisible(el)) { thinkingVisible = true; break; }
+    if (thinkingVisible) break;
+  }
+  const nodes = [];
+  for (const s of msg) for (const n of Array.from(document.querySelectorAll(s))) nodes.push(n);
+  if (!nodes.length) return { markdown: "", text: "", html: "", thinking: thinkingVisible, hash: null };
+  const target = nodes[nodes.length - 1];
+  const markdown = [];
+  for (const s of md) for (const n of Array.from(target.querySelectorAll(s))) { const t = (n.innerText || "").trim(); if (t) markdown.push(t); }
+  const tableToMd = (table) => {
+    const rows = Array.from(table.querySelectorAll("tr"));
+    if (!rows.length) return "";
+    const matrix = rows.map((tr) => Array.from(tr.querySelectorAll("th,td")).map((c) => (c.innerText || "").replace(/\\n+/g, " ").trim()));
+    if (!matrix.length) return "";
+    const h = matrix[0], b = matrix.slice(1);
+    const fmt = (arr) => "| " + arr.map((v) => v || " ").join(" | ") + " |";
+    const out = [fmt(h), "| " + h.map(() => "---").join(" | ") + " |"];
+    for (const r of b) out.push(fmt(r));
+    return out.join("\\n");
+  };
+  for (const t of Array.from(target.querySelectorAll("table"))) { const m = tableToMd(t); if (m) markdown.push(m); }
+  const markdownText = markdown.join("\\n\\n").trim();
+  const text = (target.innerText || "").trim();
+  const candidate = markdownText || text;
+  let hash = 5381;
+  for (let i = 0; i < candidate.length; i++) hash = ((hash * 33) ^ candidate.charCodeAt(i)) >>> 0;
+  return { markdown: markdownText, text, html: (target.innerHTML || "").trim(), thinking: thinkingVisible, hash: hash + ":" + candidate.length };
+}
+"""
+
+# Multi-pattern marker scan done in-browser so only the matched marker (or an
+# empty string) crosses the wire instead of the full rendered body text.
+MARKER_JS = """
+(markers) => {
+  const b = ((document.body && document.body.innerText) || "").toLowerCase();
+  for (const m of markers) if (b.indexOf(m) >= 0) return m;
+  return "";
+}
+"""
+
+# In-DOM model selection: find the picker button and click the matching
+# option without paying Playwright's locator resolution twice per job.
+SELECT_MODEL_JS = """
+(name) => {
+  const buttons = [...document.querySelectorAll("button")];
+  const picker = buttons.find((b) => /model|gpt|o1|reason/i.test(b.textContent || ""));
+  if (!picker) return false;
+  picker.click();
+  return new Promise((resolve) => setTimeout(() => {
+    const opt = [...document.querySelectorAll('[role="option"],button,li')].find((e) => (e.textContent || "").includes(name));
+    if (opt) { opt.click(); resolve(true); } else { resolve(false); }
+  }, 120));
+}
+"""
 
 
 def _bool_env(name: str, default: bool) -> bool:
@@ -95,40 +277,77 @@ def _bool_env(name: str, default: bool) -> bool:
     return default
 
 
+_SAFE_HEADER_KEYS = frozenset({"content-type", "user-agent", "x-request-id"})
+
+
 def _safe_headers(headers: Any) -> Dict[str, str]:
-    out: Dict[str, str] = {}
-    for k, v in headers.items():
-        lk = k.lower()
-        if lk == "authorization":
-            out[k] = "<redacted>"
-        elif lk in {"content-type", "user-agent", "x-request-id"}:
-            out[k] = v
-    return out
+    return {
+        k: ("<redacted>" if lk == "authorization" else v)
+        for k, v in headers.items()
+        if (lk := k.lower()) == "authorization" or lk in _SAFE_HEADER_KEYS
+    }
 
 
 class TrafficLog:
+    """Ring of preallocated slots with a monotonically increasing sequence.
+
+    Writers publish into ``slot = seq % capacity`` without taking a lock;
+    each bytecode-level step is atomic under the GIL, and a stale read in a
+    debug log is acceptable. Only ``recent``/``clear`` take a small lock
+    while snapshotting.
+    """
+
     def __init__(self, max_entries: int) -> None:
-        self._rows: deque[Dict[str, Any]] = deque(maxlen=max(1, max_entries))
+        self._capacity = max(1, int(max_entries))
+        self._slots: List[Optional[Dict[str, Any]]] = [None] * self._capacity
+        self._seq = itertools.count()
+        self._high = 0
+        self._index: Dict[str, Tuple[int, Dict[str, Any]]] = {}
         self._lock = threading.Lock()
 
     def add_request(self, row: Dict[str, Any]) -> None:
-        with self._lock:
-            self._rows.append(row)
+        i = next(self._seq)
+        slot = i % self._capacity
+        old = self._slots[slot]
+        if old is not None:
+            self._index.pop(str(old.get("request_id") or ""), None)
+        self._slots[slot] = row
+        req_id = str(row.get("request_id") or "")
+        if req_id:
+            self._index[req_id] = (i, row)
+        self._high = i + 1
 
     def add_response(self, req_id: str, response: Dict[str, Any]) -> None:
-        with self._lock:
-            for row in reversed(self._rows):
-                if row.get("request_id") == req_id:
-                    row["response"] = response
-                    break
+        entry = self._index.get(req_id)
+        if entry is None:
+            return
+        i, row = entry
+        # Only mutate if the slot still holds this row (it may have been
+        # overwritten by a wrapping writer since the lookup).
+        if self._slots[i % self._capacity] is row:
+            row["response"] = response
 
     def recent(self, limit: int) -> List[Dict[str, Any]]:
+        capped = max(1, limit)
         with self._lock:
-            return list(self._rows)[-max(1, limit):]
+            end = self._high
+            rows: List[Dict[str, Any]] = []
+            for k in range(min(end, self._capacity)):
+                row = self._slots[(end - 1 - k) % self._capacity]
+                if row is None:
+                    continue
+                rows.append(row)
+                if len(rows) >= capped:
+                    break
+        rows.reverse()
+        return rows
 
     def clear(self) -> None:
         with self._lock:
-            self._rows.clear()
+            self._slots = [None] * self._capacity
+            self._seq = itertools.count()
+            self._high = 0
+            self._index = {}
 
 
 @dataclass
@@ -146,10 +365,11 @@ class QueueJob:
 
 
 class PlaywrightWorker:
-    def __init__(self, *, user_data_dir: str, chat_url: str, headed: bool) -> None:
+    def __init__(self, *, user_data_dir: str, chat_url: str, headed: bool, pool_size: int = PAGE_POOL_SIZE_DEFAULT) -> None:
         self.user_data_dir = user_data_dir
         self.chat_url = chat_url
         self.headed = headed
+        self.pool_size = max(1, int(pool_size))
         self.timeout_ms = int(TIMEOUT_SECONDS * 1000)
 
         self._thread: Optional[threading.Thread] = None
@@ -159,10 +379,16 @@ class PlaywrightWorker:
 
         self._playwright = None
         self._context = None
-        self._page = None
+        self._pages: List[Any] = []
+        self._standby_page: Optional[Any] = None
+        self._idle_pages: Optional[asyncio.Queue] = None
+        self._sem: Optional[asyncio.Semaphore] = None
         self._queue: Optional[asyncio.Queue] = None
         self._job_task: Optional[asyncio.Task] = None
         self._watchdog_task: Optional[asyncio.Task] = None
+        # Strong refs to fire-and-forget tasks: the loop only keeps weak
+        # ones, and a GC'd job task would leave its future unresolved.
+        self._tasks: set = set()
 
     def start(self) -> None:
         self._thread = threading.Thread(target=self._run_loop, daemon=True, name="cortex-worker")
@@ -206,10 +432,18 @@ class PlaywrightWorker:
         os.makedirs(self.user_data_dir, exist_ok=True)
         self._playwright = await async_playwright().start()
         self._queue = asyncio.Queue()
+        self._idle_pages = asyncio.Queue()
+        self._sem = asyncio.Semaphore(self.pool_size)
         await self._restart_context("bootstrap")
         self._job_task = asyncio.create_task(self._job_loop())
         self._watchdog_task = asyncio.create_task(self._watchdog_loop())
 
+    def _spawn_task(self, coro) -> asyncio.Task:
+        task = asyncio.create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
     async def _shutdown(self) -> None:
         for task in (self._job_task, self._watchdog_task):
             if task:
@@ -218,6 +452,11 @@ class PlaywrightWorker:
                     await task
                 except Exception:
                     pass
+        outstanding = list(self._tasks)
+        for task in outstanding:
+            task.cancel()
+        if outstanding:
+            await asyncio.gather(*outstanding, return_exceptions=True)
         await self._close_context()
         if self._playwright:
             await self._playwright.stop()
@@ -229,7 +468,16 @@ class PlaywrightWorker:
             except Exception:
                 pass
         self._context = None
-        self._page = None
+        self._pages = []
+        self._standby_page = None
+        # Drain rather than rebind: coroutines blocked in _acquire_page hold a
+        # reference to this queue object, and a fresh one would strand them.
+        if self._idle_pages is not None:
+            while True:
+                try:
+                    self._idle_pages.get_nowait()
+                except asyncio.QueueEmpty:
+                    break
 
     async def _restart_context(self, reason: str) -> None:
         _ = reason
@@ -242,17 +490,102 @@ class PlaywrightWorker:
         )
         ctx.set_default_timeout(self.timeout_ms)
         ctx.set_default_navigation_timeout(self.timeout_ms)
-        page = ctx.pages[0] if ctx.pages else await ctx.new_page()
-        await page.route("**/*", self._route_handler)
-        await page.goto(self.chat_url, wait_until="domcontentloaded", timeout=self.timeout_ms)
         self._context = ctx
-        self._page = page
+        first = ctx.pages[0] if ctx.pages else None
+        for _i in range(self.pool_size):
+            if first is not None:
+                page, first = first, None
+                await self._setup_page(page)
+                self._pages.append(page)
+            else:
+                page = await self._new_page()
+            self._idle_pages.put_nowait(page)
+        await self._spawn_standby()
+
+    async def _setup_page(self, page) -> None:
+        try:
+            cdp = await self._context.new_cdp_session(page)
+            await cdp.send("Network.enable")
+            await cdp.send("Network.setBlockedURLs", {"urls": CDP_BLOCKED_URL_PATTERNS})
+        except Exception:
+            # CDP is Chromium-only; fall back to the Python route callback.
+            await page.route("**/*", self._route_handler)
+        page._cmk_locators = {s: page.locator(s).first for s in CACHED_SELECTORS}
+        page._cmk_visible = {s: page.locator(f"{s}:visible").first for s in VISIBLE_CACHED_SELECTORS}
+        await page.goto(self.chat_url, wait_until="domcontentloaded", timeout=self.timeout_ms)
+
+    @staticmethod
+    def _locator(page, sel: str, *, visible: bool = False):
+        cache = getattr(page, "_cmk_visible" if visible else "_cmk_locators", None)
+        if cache is not None:
+            loc = cache.get(sel)
+            if loc is not None:
+                return loc
+        return page.locator(f"{sel}:visible" if visible else sel).first
+
+    async def _new_page(self, *, register: bool = True):
+        if self._context is None:
+            raise RuntimeError("Browser context not available.")
+        page = await self._context.new_page()
+        await self._setup_page(page)
+        if register:
+            self._pages.append(page)
+        return page
+
+    async def _spawn_standby(self) -> None:
+        try:
+            self._standby_page = await self._new_page(register=False)
+        except Exception:
+            self._standby_page = None
+
+    def _take_standby(self):
+        page = self._standby_page
+        self._standby_page = None
+        if page is not None and not page.is_closed():
+            return page
+        return None
+
+    async def _acquire_page(self):
+        while True:
+            page = await self._idle_pages.get()
+            if not page.is_closed():
+                return page
+            if page in self._pages:
+                self._pages.remove(page)
+            if len(self._pages) >= self.pool_size:
+                continue
+            try:
+                new_page = await self._new_page()
+            except Exception:
+                await self._restart_context("acquire: context lost")
+                continue
+            return new_page
+
+    @staticmethod
+    def _host_of(url: str) -> str:
+        i = url.find("://")
+        start = i + 3 if i >= 0 else 0
+        end = url.find("/", start)
+        host = url[start:] if end < 0 else url[start:end]
+        port = host.find(":")
+        if port >= 0:
+            host = host[:port]
+        return host.lower()
+
+    @staticmethod
+    def _host_blocked(host: str) -> bool:
+        # Walk the host label by label so only registrable suffixes match,
+        # instead of substring-scanning every blocked domain.
+        while host:
+            if host in BLOCKED_DOMAINS:
+                return True
+            _, _, host = host.partition(".")
+        return False
 
     async def _route_handler(self, route, req) -> None:
         try:
-            host = (urllib.parse.urlparse(req.url).hostname or "").lower()
             rtype = (req.resource_type or "").lower()
-            if any(d in host for d in BLOCKED_DOMAINS) or rtype in BLOCKED_RESOURCE_TYPES:
+            if rtype in BLOCKED_RESOURCE_TYPES or self._host_blocked(self._host_of(req.url)):
                 await route.abort()
                 return
         except Exception:
@@ -262,13 +595,40 @@ class PlaywrightWorker:
     async def _watchdog_loop(self) -> None:
         while not self._stop.is_set():
             await asyncio.sleep(WATCHDOG_INTERVAL_SECONDS)
-            if self._page is None or self._page.is_closed():
-                await self._restart_context("watchdog: page missing/closed")
+            if self._context is None or not self._pages:
+                await self._restart_context("watchdog: context missing")
                 continue
-            try:
-                await asyncio.wait_for(self._page.evaluate("() => document.readyState"), timeout=4.0)
-            except Exception:
-                await self._restart_context("watchdog: renderer freeze")
+            for page in list(self._pages):
+                dead = page.is_closed()
+                if not dead:
+                    # A renderer can hang while its page object stays open;
+                    # a bounded readyState probe catches that.
+                    try:
+                        await asyncio.wait_for(
+                            page.evaluate("document.readyState"),
+                            timeout=WATCHDOG_PROBE_TIMEOUT_SECONDS,
+                        )
+                    except Exception:
+                        dead = True
+                        try:
+                            await page.close()
+                        except Exception:
+                            pass
+                if not dead:
+                    continue
+                if page in self._pages:
+                    self._pages.remove(page)
+                replacement = self._take_standby()
+                if replacement is not None:
+                    self._pages.append(replacement)
+                    self._spawn_task(self._spawn_standby())
+                else:
+                    try:
+                        replacement = await self._new_page()
+                    except Exception:
+                        await self._restart_context("watchdog: page replacement failed")
+                        break
+                self._idle_pages.put_nowait(replacement)
 
     async def _job_loop(self) -> None:
         while not self._stop.is_set():
@@ -276,41 +636,83 @@ class PlaywrightWorker:
             if job is None:
                 self._queue.task_done()
                 break
-            try:
-                result = await self._run_job_with_recovery(job)
-                job.future.set_result(result)
-            except Exception as exc:
-                job.future.set_exception(exc)
-            finally:
-                self._queue.task_done()
+            await self._sem.acquire()
+            self._spawn_task(self._run_one(job))
+
+    async def _run_one(self, job: QueueJob) -> None:
+        try:
+            result = await self._run_job_with_recovery(job)
+            job.future.set_result(result)
+        except Exception as exc:
+            job.future.set_exception(exc)
+        finally:
+            self._sem.release()
+            self._queue.task_done()
 
     async def _run_job_with_recovery(self, job: QueueJob) -> Dict[str, Any]:
-        for attempt in range(2):
+        page = await self._acquire_page()
+        try:
+            for attempt in range(2):
+                try:
+                    return await self._run_job(page, job)
+                except Exception as exc:
+                    recoverable = any(s in str(exc).lower() for s in ("target closed", "timed out", "rate limit", "context"))
+                    if attempt == 0 and recoverable:
+                        page = await self._replace_page(page)
+                        continue
+                    raise
+            raise RuntimeError("Unreachable job recovery state.")
+        finally:
+            await self._release_page(page)
+
+    async def _release_page(self, page) -> None:
+        if page.is_closed():
+            return
+        # The watchdog and in-job recovery can both replace the same lost
+        # page, leaving one page too many; close surplus pages on release so
+        # the pool never grows past pool_size.
+        if len(self._pages) > self.pool_size and page in self._pages:
+            self._pages.remove(page)
             try:
-                return await self._run_job(job)
-            except Exception as exc:
-                recoverable = any(s in str(exc).lower() for s in ("target closed", "timed out", "rate limit", "context"))
-                if attempt == 0 and recoverable:
-                    await self._restart_context(f"recover: {exc}")
-                    continue
-                raise
-        raise RuntimeError("Unreachable job recovery state.")
-
-    async def _run_job(self, job: QueueJob) -> Dict[str, Any]:
-        if not self._page:
-            await self._restart_context("job: no page")
-        assert self._page is not None
-        await self._ensure_ready()
-        await self._check_rate_limit()
-        await self._select_model(job.payload.model)
+                await page.close()
+            except Exception:
+                pass
+            return
+        self._idle_pages.put_nowait(page)
+
+    async def _replace_page(self, page):
+        if page in self._pages:
+            self._pages.remove(page)
+        try:
+            await page.close()
+        except Exception:
+            pass
+        # Promote the warm standby when one is ready: recovery then costs a
+        # tab swap instead of a navigation, and a fresh standby is spawned in
+        # the background.
+        standby = self._take_standby()
+        if standby is not None:
+            self._pages.append(standby)
+            self._spawn_task(self._spawn_standby())
+            return standby
+        try:
+            return await self._new_page()
+        except Exception:
+            await self._restart_context("replace: context lost")
+            return await self._acquire_page()
+
+    async def _run_job(self, page, job: QueueJob) -> Dict[str, Any]:
+        await self._ensure_ready(page)
+        await self._check_rate_limit(page)
+        await self._select_model(page, job.payload.model)
         image_paths = await self._materialize_images(job.payload.image_urls)
         try:
             if image_paths:
-                await self._upload_images(image_paths)
-            await self._inject_prompt(job.payload.prompt_text)
-            await self._click_send()
-            await self._wait_for_thinking_cycle()
-            md, text, html = await self._wait_for_final()
+                await self._upload_images(page, image_paths)
+            await self._inject_prompt(page, job.payload.prompt_text)
+            await self._click_send(page)
+            await self._wait_for_thinking_cycle(page)
+            md, text, html = await self._wait_for_final(page)
         finally:
             await self._cleanup_files(image_paths)
         content = md.strip() or text.strip()
@@ -324,78 +726,75 @@ class PlaywrightWorker:
             "_debug": {"markdown": md, "text": text, "html": html},
         }
 
-    async def _ensure_ready(self) -> None:
-        assert self._page is not None
-        if not self._page.url.startswith(self.chat_url):
-            await self._page.goto(self.chat_url, wait_until="domcontentloaded", timeout=self.timeout_ms)
-        await self._wait_for_ready_composer()
+    async def _ensure_ready(self, page) -> None:
+        if not page.url.startswith(self.chat_url):
+            await page.goto(self.chat_url, wait_until="domcontentloaded", timeout=self.timeout_ms)
+        await self._wait_for_ready_composer(page)
 
-    async def _wait_for_ready_composer(self) -> None:
-        assert self._page is not None
+    async def _wait_for_ready_composer(self, page) -> None:
         deadline = time.monotonic() + 120.0
         last_title = ""
         last_preview = ""
+        probe_args = {"composer": TEXTAREA_SELECTORS + EDITABLE_SELECTORS, "challenge": list(CHALLENGE_MARKERS)}
+        interval = 0.05
         while time.monotonic() < deadline:
             try:
-                last_title = await self._page.title()
-            except Exception:
-                last_title = ""
-            try:
-                body_text = await self._page.evaluate(
-                    "() => ((document.body && document.body.innerText) ? document.body.innerText : '')"
-                )
+                probe = await page.evaluate(READY_PROBE_JS, probe_args)
             except Exception:
-                body_text = ""
-            last_preview = str(body_text or "")[:220]
-            low_title = last_title.lower()
-            low_body = str(body_text or "").lower()
-            if any(marker in low_title or marker in low_body for marker in CHALLENGE_MARKERS):
-                await asyncio.sleep(2.0)
-                continue
-            if await self._any_visible(TEXTAREA_SELECTORS + EDITABLE_SELECTORS):
-                return
-            await asyncio.sleep(0.5)
+                probe = None
+            if isinstance(probe, dict):
+                last_title = probe.get("title") or ""
+                last_preview = probe.get("preview") or ""
+                if probe.get("challenge"):
+                    await asyncio.sleep(2.0)
+                    continue
+                if probe.get("hasComposer"):
+                    return
+            await asyncio.sleep(interval)
+            interval = min(interval * 1.25, 0.5)
         raise RuntimeError(f"Chat page not ready. title={last_title} preview={last_preview}")
 
-    async def _check_rate_limit(self) -> None:
-        assert self._page is not None
-        body = str(await self._page.evaluate("() => (document.body && document.body.innerText) ? document.body.innerText.toLowerCase() : ''"))
-        if any(marker in body for marker in RATE_LIMIT_MARKERS):
+    async def _check_rate_limit(self, page) -> None:
+        hit = await page.evaluate(MARKER_JS, list(RATE_LIMIT_MARKERS))
+        if hit:
             raise RuntimeError("Rate limited/frozen state detected.")
 
-    async def _select_model(self, model_name: str) -> None:
+    async def _select_model(self, page, model_name: str) -> None:
         if not model_name:
             return
-        assert self._page is not None
         try:
-            picker = self._page.get_by_role("button", name=re.compile("model|gpt|o1|reason", re.I)).first
+            if await page.evaluate(SELECT_MODEL_JS, model_name):
+                return
+        except Exception:
+            pass
+        try:
+            picker = page.get_by_role("button", name=re.compile("model|gpt|o1|reason", re.I)).first
             await picker.click(timeout=2500)
-            await self._page.get_by_text(model_name, exact=False).first.click(timeout=4000)
+            await page.get_by_text(model_name, exact=False).first.click(timeout=4000)
         except Exception:
             return
 
-    async def _inject_prompt(self, prompt: str) -> None:
+    async def _inject_prompt(self, page, prompt: str) -> None:
         if len(prompt) > PROMPT_CLIPBOARD_THRESHOLD:
-            ok = await self._inject_clipboard(prompt)
+            ok = await self._inject_clipboard(page, prompt)
             if not ok:
                 raise RuntimeError("Clipboard injection failed for long prompt.")
             return
         try:
-            await self._inject_fill(prompt)
+            await self._inject_fill(page, prompt)
             return
         except RuntimeError:
             pass
         # ChatGPT UI can render composer as contenteditable instead of textarea.
-        ok = await self._inject_clipboard(prompt)
+        ok = await self._inject_clipboard(page, prompt)
         if not ok:
             raise RuntimeError("Prompt input not found.")
 
-    async def _inject_fill(self, prompt: str) -> None:
-        assert self._page is not None
+    async def _inject_fill(self, page, prompt: str) -> None:
         for sel in TEXTAREA_SELECTORS:
             try:
-                loc = self._page.locator(f"{sel}:visible").first
-                if await loc.count() == 0:
+                loc = self._locator(page, sel, visible=True)
+                if not await loc.is_visible():
                     continue
                 await loc.fill(prompt, timeout=5000)
                 return
@@ -403,12 +802,12 @@ class PlaywrightWorker:
                 continue
         for sel in EDITABLE_SELECTORS:
             try:
-                loc = self._page.locator(f"{sel}:visible").first
-                if await loc.count() == 0:
+                loc = self._locator(page, sel, visible=True)
+                if not await loc.is_visible():
                     continue
                 await loc.click(timeout=5000)
-                await self._page.keyboard.press("Control+A")
-                await self._page.keyboard.type(prompt, delay=0)
+                await page.keyboard.press("Control+A")
+                await page.keyboard.type(prompt, delay=0)
                 return
             except Exception:
                 continue
@@ -416,18 +815,17 @@ class PlaywrightWorker:
         url = ""
         preview = ""
         try:
-            title = await self._page.title()
-            url = self._page.url
-            preview = await self._page.evaluate(
+            title = await page.title()
+            url = page.url
+            preview = await page.evaluate(
                 "() => ((document.body && document.body.innerText) ? document.body.innerText : '').slice(0, 180)"
             )
         except Exception:
             pass
-        detail = f"Prompt input not found. url={url} title={title} preview={str(preview)}".strip()
+        detail = f"Prompt input not found. url={url} title={title} preview={preview}".strip()
         raise RuntimeError(detail)
 
-    async def _inject_clipboard(self, prompt: str) -> bool:
-        assert self._page is not None
+    async def _inject_clipboard(self, page, prompt: str) -> bool:
         script = """
         ({ textareas, editables, text }) => {
           const isVisible = (el) => {
@@ -461,133 +859,132 @@ class PlaywrightWorker:
         }
         """
         return bool(
-            await self._page.evaluate(
+            await page.evaluate(
                 script,
                 {"textareas": TEXTAREA_SELECTORS, "editables": EDITABLE_SELECTORS, "text": prompt},
             )
         )
 
-    async def _click_send(self) -> None:
-        assert self._page is not None
+    async def _click_send(self, page) -> None:
         for sel in SEND_BUTTON_SELECTORS:
             try:
-                loc = self._page.locator(sel).first
-                if await loc.count() == 0:
+                loc = self._locator(page, sel)
+                if not await loc.is_visible():
                     continue
                 await loc.click(timeout=5000)
                 return
             except Exception:
                 continue
-        await self._page.keyboard.press("Enter")
+        await page.keyboard.press("Enter")
 
-    async def _wait_for_thinking_cycle(self) -> None:
+    async def _wait_for_thinking_cycle(self, page) -> None:
         saw = False
         appear_deadline = time.monotonic() + 45.0
+        interval = 0.05
         while time.monotonic() < appear_deadline:
-            if await self._any_visible(THINKING_SELECTORS):
+            if await self._any_visible(page, THINKING_SELECTORS):
                 saw = True
                 break
-            await asyncio.sleep(0.25)
+            await asyncio.sleep(interval)
+            interval = min(interval * 1.25, 0.25)
         if not saw:
             return
         done_deadline = time.monotonic() + TIMEOUT_SECONDS
+        interval = 0.05
         while time.monotonic() < done_deadline:
-            if not await self._any_visible(THINKING_SELECTORS):
+            if not await self._any_visible(page, THINKING_SELECTORS):
                 return
-            await asyncio.sleep(0.35)
+            await asyncio.sleep(interval)
+            interval = min(interval * 1.25, 0.4)
         raise PlaywrightTimeoutError("Thinking did not complete in 600s.")
 
-    async def _wait_for_final(self) -> Tuple[str, str, str]:
-        stable = 0
-        last = ""
+    async def _wait_for_final(self, page) -> Tuple[str, str, str]:
+        # Stability is wall-clock based so the adaptive poll interval cannot
+        # weaken the quiet period a generation pause has to outlast.
+        stable_since = None
+        last_hash = None
         final_md = ""
         final_text = ""
         final_html = ""
         deadline = time.monotonic() + TIMEOUT_SECONDS
+        interval = 0.05
         while time.monotonic() < deadline:
-            md, text, html = await self._extract_latest()
-            candidate = md.strip() or text.strip()
-            if candidate and candidate == last and not await self._any_visible(THINKING_SELECTORS):
-                stable += 1
+            state = await self._extract_latest(page)
+            md = state.get("markdown") or ""
+            text = state.get("text") or ""
+            html = state.get("html") or ""
+            candidate_hash = state.get("hash")
+            has_content = bool(md.strip() or text.strip())
+            if has_content and candidate_hash == last_hash and not state.get("thinking"):
+                if stable_since is None:
+                    stable_since = time.monotonic()
+                interval = min(interval * 1.25, 0.4)
             else:
-                stable = 0
-                last = candidate
-            if candidate:
+                stable_since = None
+                last_hash = candidate_hash
+                interval = 0.05
+            if has_content:
                 final_md, final_text, final_html = md, text, html
-            if candidate and stable >= 4:
+            if stable_since is not None and time.monotonic() - stable_since >= FINAL_STABLE_SECONDS:
                 break
-            await asyncio.sleep(0.8)
+            await asyncio.sleep(interval)
         if not final_md and not final_text:
             raise PlaywrightTimeoutError("No final response detected in 600s.")
         return final_md, final_text, final_html
 
-    async def _extract_latest(self) -> Tuple[str, str, str]:
-        assert self._page is not None
-        script = """
-        (msgSelectors, mdSelectors) => {
-          const nodes = [];
-          for (const s of msgSelectors) for (const n of Array.from(document.querySelectorAll(s))) nodes.push(n);
-          if (!nodes.length) return { markdown: "", text: "", html: "" };
-          const msg = nodes[nodes.length - 1];
-          const markdown = [];
-          for (const s of mdSelectors) for (const n of Array.from(msg.querySelectorAll(s))) { const t = (n.innerText || "").trim(); if (t) markdown.push(t); }
-          const tableToMd = (table) => {
-            const rows = Array.from(table.querySelectorAll("tr"));
-            if (!rows.length) return "";
-            const matrix = rows.map((tr) => Array.from(tr.querySelectorAll("th,td")).map((c) => (c.innerText || "").replace(/\\n+/g, " ").trim()));
-            if (!matrix.length) return "";
-            const h = matrix[0], b = matrix.slice(1);
-            const fmt = (arr) => "| " + arr.map((v) => v || " ").join(" | ") + " |";
-            const out = [fmt(h), "| " + h.map(() => "---").join(" | ") + " |"];
-            for (const r of b) out.push(fmt(r));
-            return out.join("\\n");
-          };
-          for (const t of Array.from(msg.querySelectorAll("table"))) { const md = tableToMd(t); if (md) markdown.push(md); }
-          return { markdown: markdown.join("\\n\\n").trim(), text: (msg.innerText || "").trim(), html: (msg.innerHTML || "").trim() };
-        }
-        """
-        out = await self._page.evaluate(script, ASSISTANT_SELECTORS, MARKDOWN_SELECTORS)
+    async def _extract_latest(self, page) -> Dict[str, Any]:
+        out = await page.evaluate(
+            FINAL_STATE_JS,
+            {"msg": ASSISTANT_SELECTORS, "md": MARKDOWN_SELECTORS, "thinking": THINKING_SELECTORS},
+        )
         if not isinstance(out, dict):
-            return "", "", ""
-        return str(out.get("markdown") or ""), str(out.get("text") or ""), str(out.get("html") or "")
+            return {"markdown": "", "text": "", "html": "", "thinking": False, "hash": None}
+        return out
 
-    async def _any_visible(self, selectors: List[str]) -> bool:
-        assert self._page is not None
-        for sel in selectors:
-            try:
-                loc = self._page.locator(sel).first
-                if await loc.count() > 0 and await loc.is_visible():
-                    return True
-            except Exception:
-                continue
-        return False
+    async def _any_visible(self, page, selectors: List[str]) -> bool:
+        try:
+            return bool(await page.evaluate(ANY_VISIBLE_JS, selectors))
+        except Exception:
+            return False
 
-    async def _upload_images(self, paths: List[str]) -> None:
-        assert self._page is not None
-        inp = self._page.locator("input[type='file']").first
+    async def _upload_images(self, page, paths: List[str]) -> None:
+        inp = self._locator(page, "input[type='file']")
         if await inp.count() == 0:
             raise RuntimeError("image_url provided but file input not found.")
         await inp.set_input_files(paths)
         for sel in UPLOAD_READY_SELECTORS:
             try:
-                await self._page.locator(sel).first.wait_for(state="visible", timeout=10000)
+                await self._locator(page, sel).wait_for(state="visible", timeout=10000)
                 return
             except Exception:
                 continue
         await asyncio.sleep(0.5)
 
     async def _materialize_images(self, image_urls: List[str]) -> List[str]:
-        return [await asyncio.to_thread(self._materialize_one, url) for url in image_urls]
+        if not image_urls:
+            return []
+        results = await asyncio.gather(
+            *(asyncio.to_thread(self._materialize_one, url) for url in image_urls),
+            return_exceptions=True,
+        )
+        paths = [p for p in results if isinstance(p, str)]
+        errors = [e for e in results if isinstance(e, BaseException)]
+        if errors:
+            self._cleanup_files_sync(paths)
+            raise errors[0]
+        return paths
 
     def _materialize_one(self, image_url: str) -> str:
         if image_url.startswith("data:"):
             header, encoded = image_url.split(",", 1)
-            mt = re.match(r"data:(image/[a-zA-Z0-9.+-]+);base64", header)
-            if not mt:
-                raise RuntimeError("Unsupported data URL image payload.")
-            mime = mt.group(1).lower()
+            mime = DATA_URL_MIME_BY_HEADER.get(header)
+            if mime is None:
+                mt = DATA_URL_HEADER_RE.match(header)
+                if not mt:
+                    raise RuntimeError("Unsupported data URL image payload.")
+                mime = mt.group(1).lower()
             ext = ".png" if mime not in {"image/jpeg", "image/webp"} else (".jpg" if mime == "image/jpeg" else ".webp")
-            raw = base64.b64decode(encoded, validate=False)
+            raw = binascii.a2b_base64(encoded)
         else:
             req = urllib.request.Request(image_url, headers={"User-Agent": "cortex-sidecar/1.0"}, method="GET")
             with urllib.request.urlopen(req, timeout=60) as rsp:
@@ -595,11 +992,22 @@ class PlaywrightWorker:
                 ctype = (rsp.headers.get("Content-Type") or "").lower()
             ext = ".jpg" if "jpeg" in ctype else (".webp" if "webp" in ctype else ".png")
         fd, path = tempfile.mkstemp(prefix="cortex-upload-", suffix=ext)
-        with os.fdopen(fd, "wb") as f:
-            f.write(raw)
+        try:
+            os.write(fd, raw)
+        finally:
+            os.close(fd)
         return path
 
     async def _cleanup_files(self, paths: List[str]) -> None:
+        if not paths:
+            return
+        if len(paths) == 1:
+            # A single unlink is cheaper than the thread hop it would ride on.
+            try:
+                os.remove(paths[0])
+            except Exception:
+                pass
+            return
         await asyncio.to_thread(self._cleanup_files_sync, paths)
 
     def _cleanup_files_sync(self, paths: List[str]) -> None:
@@ -610,7 +1018,8 @@ class PlaywrightWorker:
                 pass
 
     async def _diagnostics(self) -> Dict[str, Any]:
-        if self._page is None:
+        page = self._pages[0] if self._pages else None
+        if page is None or page.is_closed():
             return {"ready": False, "error": "No active page/context."}
         try:
             selectors = list(dict.fromkeys(TEXTAREA_SELECTORS + EDITABLE_SELECTORS + SEND_BUTTON_SELECTORS))
@@ -619,22 +1028,23 @@ class PlaywrightWorker:
                 all_count = 0
                 visible_count = 0
                 try:
-                    loc = self._page.locator(sel)
+                    loc = page.locator(sel)
                     all_count = await loc.count()
-                    visible_count = await self._page.locator(f"{sel}:visible").count()
+                    visible_count = await page.locator(f"{sel}:visible").count()
                 except Exception:
                     pass
                 counts[sel] = {"all": int(all_count), "visible": int(visible_count)}
 
-            body_preview = await self._page.evaluate(
+            body_preview = await page.evaluate(
                 "() => ((document.body && document.body.innerText) ? document.body.innerText : '').slice(0, 1200)"
             )
             return {
                 "ready": True,
-                "url": self._page.url,
-                "title": await self._page.title(),
+                "url": page.url,
+                "title": await page.title(),
                 "selectors": counts,
                 "body_preview": str(body_preview or ""),
+                "pool_size": len(self._pages),
             }
         except Exception as exc:
             return {"ready": False, "error": f"Diagnostics failed: {exc}"}
@@ -697,6 +1107,16 @@ def create_app(
     app = Flask(__name__)
     traffic = TrafficLog(traffic_max_entries)
 
+    # Both payloads are pure functions of create_app arguments; serialize once
+    # instead of per request.
+    health_payload = json.dumps({"status": "ok"}).encode("utf-8")
+    models_payload = json.dumps(
+        {
+            "object": "list",
+            "data": [{"id": m, "object": "model", "owned_by": "owner"} for m in build_model_list(expose_reasoning_models)],
+        }
+    ).encode("utf-8")
+
     @app.before_request
     def _before() -> None:
         if request.path.startswith("/debug/traffic"):
@@ -707,12 +1127,21 @@ def create_app(
         g.req_id = req_id
         g.req_started = time.perf_counter()
         payload = None
-        raw = request.get_data(cache=True, as_text=True) or ""
-        if raw:
+        raw_bytes = request.get_data(cache=True) or b""
+        size = len(raw_bytes)
+        if size > TRAFFIC_BODY_LOG_MAX_BYTES:
+            # Large bodies are never logged whole; avoid decoding and parsing
+            # hundreds of KB just to keep a debug row.
+            payload = {
+                "_truncated": True,
+                "size": size,
+                "preview": raw_bytes[:2000].decode("utf-8", errors="ignore"),
+            }
+        elif size:
             try:
-                payload = json.loads(raw)
+                payload = _json_loads(raw_bytes)
             except Exception:
-                payload = raw[:5000]
+                payload = raw_bytes.decode("utf-8", errors="ignore")[:5000]
         traffic.add_request(
             {
                 "request_id": req_id,
@@ -756,18 +1185,17 @@ def create_app(
     @app.get("/")
     @app.get("/health")
     def health() -> Response:
-        return jsonify({"status": "ok"})
+        return Response(health_payload, mimetype="application/json")
 
     @app.get("/v1/models")
     def models() -> Response:
-        data = [{"id": m, "object": "model", "owned_by": "owner"} for m in build_model_list(expose_reasoning_models)]
-        return jsonify({"object": "list", "data": data})
+        return Response(models_payload, mimetype="application/json")
 
     @app.get("/debug/traffic")
     def get_traffic() -> Response:
         limit = request.args.get("limit", default=100, type=int)
         rows = traffic.recent(limit)
-        return jsonify({"count": len(rows), "data": rows})
+        return _json_response({"count": len(rows), "data": rows})
 
     @app.delete("/debug/traffic")
     def clear_traffic() -> Response:
@@ -802,8 +1230,10 @@ def create_app(
             return jsonify({"error": {"message": f"Playwright timeout: {exc}"}}), 504
         except Exception as exc:
             return jsonify({"error": {"message": f"Worker failure: {exc}"}}), 502
-        completion.pop("_debug", None)
-        return jsonify(completion), 200
+        # Filter into a fresh dict rather than popping in place: the future's
+        # result may alias a dict the worker still owns.
+        completion = {k: v for k, v in completion.items() if k != "_debug"}
+        return _json_response(completion)
 
     return app
 
@@ -857,6 +1287,7 @@ def parse_args() -> argparse.Namespace:
     serve.add_argument("--chat-url", default=os.getenv("CHATMOCK_CHAT_URL", CHAT_URL_DEFAULT))
     serve.add_argument("--user-data-dir", default=os.getenv("CHATMOCK_USER_DATA_DIR") or os.getenv("CHATGPT_LOCAL_HOME") or "./auth")
     serve.add_argument("--headed", action=argparse.BooleanOptionalAction, default=_bool_env("CHATGPT_LOCAL_HEADED", False))
+    serve.add_argument("--page-pool-size", type=int, default=int(os.getenv("CHATGPT_LOCAL_PAGE_POOL_SIZE", str(PAGE_POOL_SIZE_DEFAULT))))
     serve.add_argument("--request-timeout", type=float, default=TIMEOUT_SECONDS)
     serve.add_argument("--upstream-timeout", type=float, default=TIMEOUT_SECONDS)
     serve.add_argument("--request-queue", action=argparse.BooleanOptionalAction, default=True)
@@ -887,7 +1318,12 @@ def main() -> None:
     if args.command == "info":
         raise SystemExit(run_legacy_info(json_output=bool(args.json)))
     if args.command == "serve":
-        worker = PlaywrightWorker(user_data_dir=args.user_data_dir, chat_url=args.chat_url, headed=bool(args.headed))
+        worker = PlaywrightWorker(
+            user_data_dir=args.user_data_dir,
+            chat_url=args.chat_url,
+            headed=bool(args.headed),
+            pool_size=max(1, int(args.page_pool_size)),
+        )
         worker.start()
         app = create_app(
             worker,
@@ -3,25 +3,102 @@ from __future__ import annotations
 import re
 from typing import Any, Dict, List
 
+try:
+    import re2 as _re2
+except ImportError:
+    _re2 = None
 
-_STRIP_TAGS_RE = re.compile(r"<(script|style|svg)\b[^>]*>.*?</\1>", flags=re.IGNORECASE | re.DOTALL)
-_HTML_COMMENT_RE = re.compile(r"<!--.*?-->", flags=re.DOTALL)
-_MULTI_BLANK_LINES_RE = re.compile(r"\n{3,}")
 
+# One alternation so large payloads are walked once instead of five times
+# (three subs plus two replaces). Blank-run collapsing matches any newline
+# flavour since CR normalization happens in the same pass. The tag branches
+# are spelled out per tag (no backreference) so the pattern stays within the
+# regular subset RE2's linear-time DFA can execute, which also rules out
+# backtracking blow-ups on adversarial HTML under stdlib re.
+_MINIFY_PATTERN = (
+    r"(?P<tag>"
+    + "|".join(rf"<{t}\b[^>]*>.*?</{t}>" for t in ("script", "style", "svg"))
+    + r")"
+    r"|(?P<cmt><!--.*?-->)"
+    r"|(?P<blanks>(?:\r\n|\r|\n){3,})"
+    r"|(?P<crlf>\r\n?)"
+)
+_MINIFY_RE = None
+_MINIFY_RE_B = None
+if _re2 is not None:
+    try:
+        _MINIFY_RE = _re2.compile(_MINIFY_PATTERN, flags=_re2.IGNORECASE | _re2.DOTALL)
+        _MINIFY_RE_B = _re2.compile(_MINIFY_PATTERN.encode("ascii"), flags=_re2.IGNORECASE | _re2.DOTALL)
+    except Exception:
+        # Module "re2" can be pyre2 (re-style flags) or google-re2 (an
+        # Options-based compile with no flag constants); only the former
+        # works here, so any failure falls back to stdlib re.
+        _MINIFY_RE = None
+        _MINIFY_RE_B = None
+if _MINIFY_RE is None or _MINIFY_RE_B is None:
+    _MINIFY_RE = re.compile(_MINIFY_PATTERN, flags=re.IGNORECASE | re.DOTALL)
+    _MINIFY_RE_B = re.compile(_MINIFY_PATTERN.encode("ascii"), flags=re.IGNORECASE | re.DOTALL)
+
+
+def _minify_sub(match: re.Match) -> str:
+    if match.group("blanks") is not None:
+        return "\n\n"
+    if match.group("crlf") is not None:
+        return "\n"
+    return ""
+
+
+def _minify_sub_b(match: re.Match) -> bytes:
+    if match.group("blanks") is not None:
+        return b"\n\n"
+    if match.group("crlf") is not None:
+        return b"\n"
+    return b""
+
+
+def minify_dom_text(text: str | bytes) -> str | bytes:
+    """Minify raw HTML-ish text while preserving meaningful structure.
+
+    ``bytes`` input is minified against a bytes-compiled pattern and decoded
+    once at the end, so oversized HTML is never scanned as a wide str.
+    """
+    if isinstance(text, bytes):
+        if not text or b"<" not in text or b">" not in text:
+            return text.decode("utf-8", errors="replace")
+        return _MINIFY_RE_B.sub(_minify_sub_b, text).strip().decode("utf-8", errors="replace")
 
-def minify_dom_text(text: str) -> str:
-    """Minify raw HTML-ish text while preserving meaningful structure."""
     if not isinstance(text, str) or not text:
         return text
 
     if "<" not in text or ">" not in text:
         return text
 
-    cleaned = _STRIP_TAGS_RE.sub("", text)
-    cleaned = _HTML_COMMENT_RE.sub("", cleaned)
-    cleaned = cleaned.replace("\r\n", "\n").replace("\r", "\n")
-    cleaned = _MULTI_BLANK_LINES_RE.sub("\n\n", cleaned)
-    return cleaned.strip()
+    return _MINIFY_RE.sub(_minify_sub, text).strip()
+
+
+def _needs_minify(value: Any, threshold: int) -> bool:
+    if isinstance(value, bytes):
+        return len(value) > threshold and b"<" in value and b">" in value
+    return isinstance(value, str) and len(value) > threshold and "<" in value and ">" in value
+
+
+def _part_needs_minify(part: Any, threshold: int) -> bool:
+    if not isinstance(part, dict):
+        return False
+    if str(part.get("type") or "").strip().lower() != "text":
+        return False
+    return _needs_minify(part.get("text"), threshold)
+
+
+def _message_needs_minify(message: Any, threshold: int) -> bool:
+    if not isinstance(message, dict):
+        return False
+    content = message.get("content")
+    if _needs_minify(content, threshold):
+        return True
+    if isinstance(content, list):
+        return any(_part_needs_minify(part, threshold) for part in content)
+    return False
 
 
 def prepare_messages_for_aggressive_mode(
@@ -32,30 +109,29 @@ def prepare_messages_for_aggressive_mode(
     if not isinstance(messages, list):
         return messages
 
+    # Common case: nothing crosses the threshold, so return the original list
+    # instead of cloning every message and part.
+    if not any(_message_needs_minify(m, large_text_threshold) for m in messages):
+        return messages
+
     normalized: List[Dict[str, Any]] = []
     for message in messages:
-        if not isinstance(message, dict):
+        if not _message_needs_minify(message, large_text_threshold):
             normalized.append(message)
             continue
 
         cloned = dict(message)
         content = cloned.get("content")
 
-        if isinstance(content, str) and len(content) > large_text_threshold:
+        if isinstance(content, (str, bytes)):
             cloned["content"] = minify_dom_text(content)
         elif isinstance(content, list):
-            parts: List[Any] = []
-            for part in content:
-                if not isinstance(part, dict):
-                    parts.append(part)
-                    continue
-                part_cloned = dict(part)
-                ptype = str(part_cloned.get("type") or "").strip().lower()
-                if ptype == "text":
-                    ptext = part_cloned.get("text")
-                    if isinstance(ptext, str) and len(ptext) > large_text_threshold:
-                        part_cloned["text"] = minify_dom_text(ptext)
-                parts.append(part_cloned)
+            parts = content.copy()
+            for i, part in enumerate(parts):
+                if _part_needs_minify(part, large_text_threshold):
+                    part_cloned = dict(part)
+                    part_cloned["text"] = minify_dom_text(part_cloned["text"])
+                    parts[i] = part_cloned
             cloned["content"] = parts
 
         normalized.append(cloned)
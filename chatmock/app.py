@@ -1,12 +1,19 @@
 from __future__ import annotations
 
 import datetime
+import itertools
 import json
+import os
 import time
-import uuid
 
 from flask import Flask, jsonify
 from flask import g, request
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from .config import BASE_INSTRUCTIONS, GPT5_CODEX_INSTRUCTIONS
 from .http import build_cors_headers
@@ -15,7 +22,28 @@ from .routes_ollama import ollama_bp
 from .traffic import TrafficLog
 
 
-def _truncate_text(value: str, limit: int = 4000) -> str:
+def _json_loads(data):
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+class _OrjsonProvider(DefaultJSONProvider):
+    """Route Flask's jsonify/get_json through orjson when it is installed."""
+
+    def dumps(self, obj, **kwargs) -> str:
+        return orjson.dumps(obj).decode("utf-8")
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
+def _truncate_text(value: str | bytes, limit: int = 4000) -> str:
+    if isinstance(value, bytes):
+        # Slice before decoding so a multi-MB body never materializes as str.
+        if len(value) <= limit:
+            return value.decode("utf-8", errors="replace")
+        return value[:limit].decode("utf-8", errors="replace") + "... [truncated]"
     if not isinstance(value, str):
         return ""
     if len(value) <= limit:
@@ -23,14 +51,27 @@ def _truncate_text(value: str, limit: int = 4000) -> str:
     return value[:limit] + "... [truncated]"
 
 
+_ALLOWED_HEADERS = frozenset({"content-type", "user-agent", "x-request-id", "x-session-id", "session_id"})
+
+# Random boot salt plus a process-wide counter: unique opaque ids without a
+# urandom syscall per request. next() on itertools.count is atomic under the
+# GIL, so no lock is needed.
+_ID_PREFIX = os.urandom(8).hex()
+_ID_COUNTER = itertools.count(1)
+
+
+def _new_request_id() -> str:
+    return f"{_ID_PREFIX}{next(_ID_COUNTER):016x}"
+
+
 def _safe_headers(headers) -> dict:
-    allowed = ("content-type", "user-agent", "x-request-id", "x-session-id", "session_id")
     out = {}
     for key, val in headers.items():
         lower = key.lower()
         if lower == "authorization":
             out[key] = "<redacted>"
-        elif lower in allowed:
+            continue
+        if lower in _ALLOWED_HEADERS:
             out[key] = val
     return out
 
@@ -52,6 +93,8 @@ def create_app(
     traffic_max_entries: int = 300,
 ) -> Flask:
     app = Flask(__name__)
+    if orjson is not None:
+        app.json = _OrjsonProvider(app)
     traffic_log = TrafficLog(max_entries=traffic_max_entries)
     app.extensions["traffic_log"] = traffic_log
 
@@ -72,6 +115,7 @@ def create_app(
         HEADED=bool(headed),
         TRAFFIC_LOG_ENABLED=bool(traffic_log_enabled),
         TRAFFIC_MAX_ENTRIES=max(1, int(traffic_max_entries)),
+        TRAFFIC_MAX_PAYLOAD_BYTES=65536,
     )
 
     @app.get("/")
@@ -83,7 +127,14 @@ def create_app(
     def debug_traffic():
         limit = request.args.get("limit", default=100, type=int)
         rows = traffic_log.recent(limit=limit)
-        return jsonify({"count": len(rows), "data": rows})
+        out = []
+        for row in rows:
+            ts = row.get("timestamp")
+            if isinstance(ts, (int, float)):
+                row = dict(row)
+                row["timestamp"] = datetime.datetime.fromtimestamp(ts, tz=datetime.timezone.utc).isoformat()
+            out.append(row)
+        return jsonify({"count": len(out), "data": out})
 
     @app.delete("/debug/traffic")
     def clear_debug_traffic():
@@ -97,27 +148,38 @@ def create_app(
         if request.path.startswith("/debug/traffic"):
             return None
 
-        request_id = uuid.uuid4().hex
+        request_id = _new_request_id()
         g.traffic_request_id = request_id
         g.traffic_start_ts = time.perf_counter()
 
         payload_preview = None
-        raw_body = ""
         try:
-            raw_body = request.get_data(cache=True, as_text=True) or ""
+            raw_bytes = request.get_data(cache=True) or b""
         except Exception:
-            raw_body = ""
-
-        if raw_body:
-            try:
-                payload_preview = json.loads(raw_body)
-            except Exception:
-                payload_preview = _truncate_text(raw_body)
+            raw_bytes = b""
+
+        if raw_bytes:
+            max_payload = int(app.config.get("TRAFFIC_MAX_PAYLOAD_BYTES", 65536))
+            if len(raw_bytes) > max_payload:
+                # Parsing a multi-MB upload just for the log would allocate the
+                # full object tree; keep a bounded preview instead.
+                payload_preview = {
+                    "_truncated": True,
+                    "size": len(raw_bytes),
+                    "preview": _truncate_text(raw_bytes),
+                }
+            else:
+                try:
+                    payload_preview = _json_loads(raw_bytes)
+                except Exception:
+                    payload_preview = _truncate_text(raw_bytes)
 
         traffic_log.record_request(
             {
                 "request_id": request_id,
-                "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+                # Raw epoch float on the hot path; formatted lazily in the
+                # /debug/traffic view.
+                "timestamp": time.time(),
                 "method": request.method,
                 "path": request.path,
                 "query": request.query_string.decode("utf-8", errors="ignore") if request.query_string else "",
@@ -139,13 +201,20 @@ def create_app(
                 duration_ms = round((time.perf_counter() - started) * 1000.0, 2)
 
             response_preview = None
-            if not resp.is_streamed:
+            content_type = resp.headers.get("Content-Type", "")
+            content_length = resp.content_length
+            if resp.is_streamed or content_type.startswith("text/event-stream"):
+                pass
+            elif content_length and content_length > 8192:
+                # Don't materialize multi-MB completion bodies just to truncate
+                # them for the log.
+                response_preview = f"<{content_length} bytes omitted>"
+            else:
                 try:
-                    content_type = resp.headers.get("Content-Type", "")
                     body_text = resp.get_data(as_text=True) or ""
                     if "application/json" in content_type:
                         try:
-                            response_preview = json.loads(body_text)
+                            response_preview = _json_loads(body_text)
                         except Exception:
                             response_preview = _truncate_text(body_text)
                     else:
@@ -159,7 +228,7 @@ def create_app(
                     "status_code": int(resp.status_code),
                     "duration_ms": duration_ms,
                     "is_streamed": bool(resp.is_streamed),
-                    "content_type": resp.headers.get("Content-Type", ""),
+                    "content_type": content_type,
                     "payload": response_preview,
                 },
             )
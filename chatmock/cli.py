@@ -303,7 +303,17 @@ def cmd_serve(
         traffic_max_entries=traffic_max_entries,
     )
 
-    app.run(host=host, debug=False, use_reloader=False, port=port, threaded=True)
+    try:
+        from waitress import serve as waitress_serve
+    except ImportError:
+        waitress_serve = None
+
+    if waitress_serve is not None:
+        # Pooled worker threads and a C-accelerated HTTP parser; the dev
+        # server spawns a fresh thread per connection.
+        waitress_serve(app, host=host, port=port, threads=16)
+    else:
+        app.run(host=host, debug=False, use_reloader=False, port=port, threaded=True)
     return 0
 
 
@@ -18,26 +18,46 @@ class RequestLease:
 
 
 class FifoRequestGate:
-    """Thread-safe FIFO gate that allows one active request at a time."""
+    """Thread-safe FIFO gate that allows one active request at a time.
+
+    Each waiter blocks on its own ticket's Event, so a release wakes only
+    the single next-in-line thread instead of notifying every waiter to
+    re-check a shared predicate.
+    """
 
     def __init__(self, enabled: bool = True) -> None:
         self.enabled = bool(enabled)
-        self._condition = threading.Condition()
+        self._lock = threading.Lock()
         self._next_ticket = 0
         self._serving_ticket = 0
         self._active = False
         self._waiting = 0
+        self._waiters: Dict[int, threading.Event] = {}
+        # Test hook: called with the ticket number once a caller is queued,
+        # so tests can order arrivals without sleeping.
+        self._on_enqueue = None
 
     def acquire(self) -> RequestLease:
         if not self.enabled:
             return RequestLease(self)
 
-        with self._condition:
+        with self._lock:
             my_ticket = self._next_ticket
             self._next_ticket += 1
+            if my_ticket == self._serving_ticket and not self._active:
+                self._active = True
+                return RequestLease(self)
+            event = threading.Event()
+            self._waiters[my_ticket] = event
             self._waiting += 1
-            while my_ticket != self._serving_ticket or self._active:
-                self._condition.wait()
+
+        on_enqueue = self._on_enqueue
+        if on_enqueue is not None:
+            on_enqueue(my_ticket)
+
+        event.wait()
+
+        with self._lock:
             self._waiting -= 1
             self._active = True
             return RequestLease(self)
@@ -45,15 +65,17 @@ class FifoRequestGate:
     def _release(self) -> None:
         if not self.enabled:
             return
-        with self._condition:
+        with self._lock:
             if not self._active:
                 return
             self._active = False
             self._serving_ticket += 1
-            self._condition.notify_all()
+            next_waiter = self._waiters.pop(self._serving_ticket, None)
+        if next_waiter is not None:
+            next_waiter.set()
 
     def snapshot(self) -> Dict[str, int | bool]:
-        with self._condition:
+        with self._lock:
             return {
                 "enabled": self.enabled,
                 "active": self._active,
@@ -1,47 +1,77 @@
 from __future__ import annotations
 
+import queue
 import threading
-from collections import deque
-from typing import Any, Deque, Dict, List
+from collections import OrderedDict
+from itertools import islice
+from typing import Any, Dict, List
 
 
 class TrafficLog:
-    """Thread-safe in-memory ring buffer for request/response traffic."""
+    """In-memory ring buffer for request/response traffic.
+
+    Entries live in one OrderedDict keyed by request_id: insertion keeps
+    arrival order, lookup by id is O(1), and eviction is a single
+    ``popitem(last=False)``.
+
+    Request threads never take a lock: writes are enqueued on a
+    ``queue.SimpleQueue`` (lock-free put) and applied by a single drain
+    thread that owns the OrderedDict. Readers enqueue a snapshot op and
+    wait for it, which also guarantees they observe every prior write.
+    """
 
     def __init__(self, max_entries: int = 300) -> None:
         self.max_entries = max(1, int(max_entries))
-        self._entries: Deque[Dict[str, Any]] = deque()
-        self._by_id: Dict[str, Dict[str, Any]] = {}
-        self._lock = threading.Lock()
+        self._log: OrderedDict[str, Dict[str, Any]] = OrderedDict()
+        self._q: queue.SimpleQueue = queue.SimpleQueue()
+        self._drainer = threading.Thread(target=self._drain, daemon=True, name="traffic-log-drain")
+        self._drainer.start()
 
     def record_request(self, entry: Dict[str, Any]) -> None:
         request_id = str(entry.get("request_id") or "")
         if not request_id:
             return
-        with self._lock:
-            self._entries.append(entry)
-            self._by_id[request_id] = entry
-            while len(self._entries) > self.max_entries:
-                old = self._entries.popleft()
-                old_id = str(old.get("request_id") or "")
-                if old_id:
-                    self._by_id.pop(old_id, None)
+        self._q.put_nowait(("req", request_id, entry))
 
     def record_response(self, request_id: str, response_meta: Dict[str, Any]) -> None:
         if not request_id:
             return
-        with self._lock:
-            entry = self._by_id.get(request_id)
-            if not isinstance(entry, dict):
-                return
-            entry["response"] = response_meta
+        self._q.put_nowait(("resp", str(request_id), response_meta))
 
     def clear(self) -> None:
-        with self._lock:
-            self._entries.clear()
-            self._by_id.clear()
+        done = threading.Event()
+        self._q.put_nowait(("clear", done))
+        done.wait(timeout=5.0)
 
     def recent(self, limit: int = 100) -> List[Dict[str, Any]]:
         capped = max(1, min(int(limit), self.max_entries))
-        with self._lock:
-            return list(self._entries)[-capped:]
+        rows: List[Dict[str, Any]] = []
+        done = threading.Event()
+        self._q.put_nowait(("snapshot", capped, rows, done))
+        done.wait(timeout=5.0)
+        return rows
+
+    def _drain(self) -> None:
+        while True:
+            op = self._q.get()
+            kind = op[0]
+            if kind == "req":
+                _, request_id, entry = op
+                self._log[request_id] = entry
+                while len(self._log) > self.max_entries:
+                    self._log.popitem(last=False)
+            elif kind == "resp":
+                _, request_id, meta = op
+                entry = self._log.get(request_id)
+                if entry is not None:
+                    entry["response"] = meta
+            elif kind == "clear":
+                self._log.clear()
+                op[1].set()
+            elif kind == "snapshot":
+                _, capped, rows, done = op
+                # islice skips the leading entries without first copying every
+                # value into a throwaway list.
+                start = max(0, len(self._log) - capped)
+                rows.extend(islice(self._log.values(), start, None))
+                done.set()
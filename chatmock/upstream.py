@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 import json
 import time
 from typing import Any, Dict, List, Tuple
@@ -16,6 +17,41 @@ from .utils import get_effective_chatgpt_auth
 
 _REQUEST_GATE = FifoRequestGate(enabled=True)
 
+# One pooled session for all upstream calls: connections (and their TLS
+# handshakes) are reused across requests instead of re-established per call.
+_SESSION = requests.Session()
+_SESSION.mount("https://", requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=16))
+
+# Credentials come off disk; cache them briefly so each request doesn't pay
+# the file read. A fresh login is picked up within the TTL.
+_AUTH_CACHE_TTL = 30.0
+_AUTH_CACHE: Dict[str, Any] = {"t": 0.0, "v": (None, None)}
+
+_BASE_HEADERS = {
+    "Content-Type": "application/json",
+    "Accept": "text/event-stream",
+    "OpenAI-Beta": "responses=experimental",
+}
+
+# Constant parts of the Responses API payload; copied and filled per call.
+_PAYLOAD_TEMPLATE = {
+    "store": False,
+    "stream": True,
+    "parallel_tool_calls": False,
+    "tool_choice": "auto",
+}
+_REASONING_INCLUDE = ["reasoning.encrypted_content"]
+
+
+def _cached_chatgpt_auth() -> Tuple[str | None, str | None]:
+    now = time.monotonic()
+    if now - _AUTH_CACHE["t"] < _AUTH_CACHE_TTL and all(_AUTH_CACHE["v"]):
+        return _AUTH_CACHE["v"]
+    value = get_effective_chatgpt_auth()
+    _AUTH_CACHE["t"] = now
+    _AUTH_CACHE["v"] = value
+    return value
+
 
 class ManagedUpstreamResponse:
     """Wrap upstream response and release queue lease when response lifecycle ends."""
@@ -24,6 +60,13 @@ class ManagedUpstreamResponse:
         self._response = response
         self._lease = lease
         self._closed = False
+        # Bind the attributes callers hit on every stream so access stays on
+        # the fast instance-dict path; __getattr__ remains as the fallback
+        # for everything else.
+        self.status_code = response.status_code
+        self.headers = response.headers
+        self.raw = response.raw
+        self.iter_content = response.iter_content
 
     def iter_lines(self, *args, **kwargs):
         try:
@@ -57,41 +100,52 @@ def _log_json(prefix: str, payload: Any) -> None:
             pass
 
 
+_MODEL_MAP = {
+    "gpt5": "gpt-5",
+    "gpt-5-latest": "gpt-5",
+    "gpt-5": "gpt-5",
+    "gpt-5.1": "gpt-5.1",
+    "gpt5.2": "gpt-5.2",
+    "gpt-5.2": "gpt-5.2",
+    "gpt-5.2-latest": "gpt-5.2",
+    "gpt5.2-codex": "gpt-5.2-codex",
+    "gpt-5.2-codex": "gpt-5.2-codex",
+    "gpt-5.2-codex-latest": "gpt-5.2-codex",
+    "gpt5-codex": "gpt-5-codex",
+    "gpt-5-codex": "gpt-5-codex",
+    "gpt-5-codex-latest": "gpt-5-codex",
+    "gpt-5.1-codex": "gpt-5.1-codex",
+    "gpt-5.1-codex-max": "gpt-5.1-codex-max",
+    "codex": "codex-mini-latest",
+    "codex-mini": "codex-mini-latest",
+    "codex-mini-latest": "codex-mini-latest",
+    "gpt-5.1-codex-mini": "gpt-5.1-codex-mini",
+}
+
+
+_EFFORT_SUFFIXES = tuple(
+    f"{sep}{effort}" for sep in ("-", "_") for effort in ("minimal", "low", "medium", "high", "xhigh")
+)
+
+
+@functools.lru_cache(maxsize=256)
+def _normalize_cached(name: str) -> str:
+    base = name.split(":", 1)[0].strip()
+    lowered = base.lower()
+    # str.endswith accepts a tuple and scans it in C, replacing the old
+    # nested separator/effort loop.
+    matched = next((s for s in _EFFORT_SUFFIXES if lowered.endswith(s)), None)
+    if matched is not None:
+        base = base[: -len(matched)]
+    return _MODEL_MAP.get(base, base)
+
+
 def normalize_model_name(name: str | None, debug_model: str | None = None) -> str:
     if isinstance(debug_model, str) and debug_model.strip():
         return debug_model.strip()
     if not isinstance(name, str) or not name.strip():
         return "gpt-5"
-    base = name.split(":", 1)[0].strip()
-    for sep in ("-", "_"):
-        lowered = base.lower()
-        for effort in ("minimal", "low", "medium", "high", "xhigh"):
-            suffix = f"{sep}{effort}"
-            if lowered.endswith(suffix):
-                base = base[: -len(suffix)]
-                break
-    mapping = {
-        "gpt5": "gpt-5",
-        "gpt-5-latest": "gpt-5",
-        "gpt-5": "gpt-5",
-        "gpt-5.1": "gpt-5.1",
-        "gpt5.2": "gpt-5.2",
-        "gpt-5.2": "gpt-5.2",
-        "gpt-5.2-latest": "gpt-5.2",
-        "gpt5.2-codex": "gpt-5.2-codex",
-        "gpt-5.2-codex": "gpt-5.2-codex",
-        "gpt-5.2-codex-latest": "gpt-5.2-codex",
-        "gpt5-codex": "gpt-5-codex",
-        "gpt-5-codex": "gpt-5-codex",
-        "gpt-5-codex-latest": "gpt-5-codex",
-        "gpt-5.1-codex": "gpt-5.1-codex",
-        "gpt-5.1-codex-max": "gpt-5.1-codex-max",
-        "codex": "codex-mini-latest",
-        "codex-mini": "codex-mini-latest",
-        "codex-mini-latest": "codex-mini-latest",
-        "gpt-5.1-codex-mini": "gpt-5.1-codex-mini",
-    }
-    return mapping.get(base, base)
+    return _normalize_cached(name)
 
 
 def start_upstream_request(
@@ -104,7 +158,7 @@ def start_upstream_request(
     parallel_tool_calls: bool = False,
     reasoning_param: Dict[str, Any] | None = None,
 ):
-    access_token, account_id = get_effective_chatgpt_auth()
+    access_token, account_id = _cached_chatgpt_auth()
     if not access_token or not account_id:
         resp = make_response(
             jsonify(
@@ -120,37 +174,29 @@ def start_upstream_request(
             resp.headers.setdefault(k, v)
         return None, resp
 
-    include: List[str] = []
-    if isinstance(reasoning_param, dict):
-        include.append("reasoning.encrypted_content")
-
-    client_session_id = None
-    try:
-        client_session_id = (
-            flask_request.headers.get("X-Session-Id")
-            or flask_request.headers.get("session_id")
-            or None
-        )
-    except Exception:
-        client_session_id = None
+    # Hit the WSGI environ dict directly; .get never raises and this skips
+    # two EnvironHeaders scans.
+    environ = flask_request.environ
+    client_session_id = environ.get("HTTP_X_SESSION_ID") or environ.get("HTTP_SESSION_ID") or None
     session_id = ensure_session_id(instructions, input_items, client_session_id)
 
-    responses_payload = {
-        "model": model,
-        "instructions": instructions if isinstance(instructions, str) and instructions.strip() else instructions,
-        "input": input_items,
-        "tools": tools or [],
-        "tool_choice": tool_choice if tool_choice in ("auto", "none") or isinstance(tool_choice, dict) else "auto",
-        "parallel_tool_calls": bool(parallel_tool_calls),
-        "store": False,
-        "stream": True,
-        "prompt_cache_key": session_id,
-    }
-    if include:
-        responses_payload["include"] = include
+    responses_payload = _PAYLOAD_TEMPLATE.copy()
+    responses_payload["model"] = model
+    responses_payload["instructions"] = (
+        instructions if isinstance(instructions, str) and instructions.strip() else instructions
+    )
+    responses_payload["input"] = input_items
+    responses_payload["tools"] = tools or []
+    if tool_choice in ("none",) or isinstance(tool_choice, dict):
+        responses_payload["tool_choice"] = tool_choice
+    if parallel_tool_calls:
+        responses_payload["parallel_tool_calls"] = True
+    responses_payload["prompt_cache_key"] = session_id
 
     if reasoning_param is not None:
         responses_payload["reasoning"] = reasoning_param
+        if isinstance(reasoning_param, dict):
+            responses_payload["include"] = _REASONING_INCLUDE
 
     verbose = False
     try:
@@ -160,14 +206,10 @@ def start_upstream_request(
     if verbose:
         _log_json("OUTBOUND >> ChatGPT Responses API payload", responses_payload)
 
-    headers = {
-        "Authorization": f"Bearer {access_token}",
-        "Content-Type": "application/json",
-        "Accept": "text/event-stream",
-        "chatgpt-account-id": account_id,
-        "OpenAI-Beta": "responses=experimental",
-        "session_id": session_id,
-    }
+    headers = _BASE_HEADERS.copy()
+    headers["Authorization"] = f"Bearer {access_token}"
+    headers["chatgpt-account-id"] = account_id
+    headers["session_id"] = session_id
 
     lease: RequestLease | None = None
     use_queue = bool(current_app.config.get("REQUEST_QUEUE_ENABLED", True))
@@ -180,7 +222,7 @@ def start_upstream_request(
         timeout_setting = None
 
     try:
-        upstream_resp = requests.post(
+        upstream_resp = _SESSION.post(
             CHATGPT_RESPONSES_URL,
             headers=headers,
             json=responses_payload,
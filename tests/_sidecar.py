@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import hashlib
+import importlib.machinery
+import importlib.util
+import pathlib
+import py_compile
+import sys
+import tempfile
+from types import ModuleType
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+CHATMOCK_SCRIPT = ROOT / "chatmock.py"
+
+_MODULE_NAME = "chatmock_sidecar_under_test"
+_CACHED: ModuleType | None = None
+
+
+def _pyc_cache_path() -> pathlib.Path:
+    # Key the cache by resolved path plus size+mtime so checkouts sharing one
+    # machine (or an edited script) can never load each other's bytecode.
+    stat = CHATMOCK_SCRIPT.stat()
+    key = hashlib.sha256(
+        f"{CHATMOCK_SCRIPT.resolve()}:{stat.st_size}:{stat.st_mtime_ns}".encode()
+    ).hexdigest()[:16]
+    return pathlib.Path(tempfile.gettempdir()) / f"chatmock_sidecar_{key}.pyc"
+
+
+def _sidecar_spec():
+    """Prefer a bytecode-cached load so parallel workers skip the .py parse."""
+    try:
+        cache_file = _pyc_cache_path()
+        if not cache_file.exists():
+            py_compile.compile(str(CHATMOCK_SCRIPT), cfile=str(cache_file), doraise=True)
+        loader = importlib.machinery.SourcelessFileLoader(_MODULE_NAME, str(cache_file))
+        return importlib.util.spec_from_file_location(_MODULE_NAME, str(cache_file), loader=loader)
+    except Exception:
+        return importlib.util.spec_from_file_location(_MODULE_NAME, CHATMOCK_SCRIPT)
+
+
+def load_sidecar_module() -> ModuleType:
+    """Load chatmock.py once and reuse it; the top-level exec is expensive."""
+    global _CACHED
+    if _CACHED is not None:
+        return _CACHED
+    cached = sys.modules.get(_MODULE_NAME)
+    if cached is not None:
+        _CACHED = cached
+        return cached
+    spec = _sidecar_spec()
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[_MODULE_NAME] = module
+    spec.loader.exec_module(module)
+    _CACHED = module
+    return module
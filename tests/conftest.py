@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+# Warm the chatmock import graph during collection so every test module
+# shares one fully-initialized sys.modules entry instead of racing to
+# import the transitive deps first.
+import chatmock.request_queue  # noqa: F401
+import chatmock.utils  # noqa: F401
+
+from _sidecar import load_sidecar_module
+
+
+@pytest.fixture(scope="session")
+def sidecar_mod():
+    return load_sidecar_module()
+
+
+@pytest.fixture(scope="session")
+def loop():
+    event_loop = asyncio.new_event_loop()
+    yield event_loop
+    event_loop.close()
@@ -1,24 +1,33 @@
 from __future__ import annotations
 
-import concurrent.futures
-import importlib.util
-import pathlib
-import sys
-from types import ModuleType
+import json
+import types
 
+import pytest
 
-ROOT = pathlib.Path(__file__).resolve().parents[1]
-CHATMOCK_SCRIPT = ROOT / "chatmock.py"
+# Serialized once; the endpoint tests POST the same payloads repeatedly.
+PAYLOAD_HELLO = json.dumps({"model": "gpt-5-high", "messages": [{"role": "user", "content": "hello"}]}).encode()
+PAYLOAD_ASSISTANT_ONLY = json.dumps({"messages": [{"role": "assistant", "content": "x"}]}).encode()
+PAYLOAD_RUN = json.dumps({"messages": [{"role": "user", "content": "run"}]}).encode()
+PAYLOAD_X = json.dumps({"messages": [{"role": "user", "content": "x"}]}).encode()
 
 
-def load_sidecar_module() -> ModuleType:
-    module_name = "chatmock_sidecar_under_test"
-    spec = importlib.util.spec_from_file_location(module_name, CHATMOCK_SCRIPT)
-    assert spec is not None and spec.loader is not None
-    module = importlib.util.module_from_spec(spec)
-    sys.modules[module_name] = module
-    spec.loader.exec_module(module)
-    return module
+class _ImmediateFuture:
+    """Already-resolved future stub: no Condition or state lock on submit."""
+
+    __slots__ = ("_result", "_error")
+
+    def __init__(self, result=None, error=None):
+        self._result = result
+        self._error = error
+
+    def result(self, timeout=None):
+        if self._error is not None:
+            raise self._error
+        return self._result
+
+    def done(self):
+        return True
 
 
 class FakeWorker:
@@ -34,20 +43,28 @@ class FakeWorker:
         }
         self.error = error
         self.submitted = []
+        # Frozen view of the canned completion: no per-submit copy, and any
+        # handler that mutates its result in place fails loudly here.
+        self._result = types.MappingProxyType(self.completion)
 
     def submit(self, payload):
         self.submitted.append(payload)
-        fut = concurrent.futures.Future()
         if self.error is not None:
-            fut.set_exception(self.error)
-        else:
-            fut.set_result(dict(self.completion))
-        return fut
+            return _ImmediateFuture(error=self.error)
+        return _ImmediateFuture(result=self._result)
+
+
+def _check_text_and_image(parsed):
+    return (
+        parsed is not None
+        and parsed.model == "gpt-5-high"
+        and parsed.prompt_text == "extract this"
+        and parsed.image_urls == ["https://example.com/snap.png"]
+    )
 
 
-def test_parse_openai_payload_supports_text_and_image_url():
-    mod = load_sidecar_module()
-    parsed = mod.parse_openai_payload(
+PARSE_CASES = [
+    pytest.param(
         {
             "model": "gpt-5-high",
             "messages": [
@@ -59,84 +76,94 @@ def test_parse_openai_payload_supports_text_and_image_url():
                     ],
                 }
             ],
-        }
-    )
-    assert parsed is not None
-    assert parsed.model == "gpt-5-high"
-    assert parsed.prompt_text == "extract this"
-    assert parsed.image_urls == ["https://example.com/snap.png"]
+        },
+        _check_text_and_image,
+        id="text-and-image-url",
+    ),
+    pytest.param(
+        {"model": "gpt-5-high", "messages": [{"role": "assistant", "content": "x"}]},
+        lambda parsed: parsed is None,
+        id="assistant-only-rejected",
+    ),
+    pytest.param({"messages": []}, lambda parsed: parsed is None, id="empty-messages-rejected"),
+]
+
+
+@pytest.mark.parametrize("payload,check", PARSE_CASES)
+def test_parse_openai_payload(sidecar_mod, payload, check):
+    assert check(sidecar_mod.parse_openai_payload(payload))
+
+
+def test_build_model_list_toggles_reasoning_models(sidecar_mod):
+    base = set(sidecar_mod.build_model_list(False))
+    expanded = set(sidecar_mod.build_model_list(True))
+    assert "gpt-5-high" not in base
+    assert "gpt-5-high" in expanded
+    assert len(expanded) > len(base)
 
 
-def test_parse_openai_payload_rejects_empty_messages():
-    mod = load_sidecar_module()
-    assert mod.parse_openai_payload({"model": "gpt-5-high", "messages": [{"role": "assistant", "content": "x"}]}) is None
-    assert mod.parse_openai_payload({"messages": []}) is None
+@pytest.fixture(scope="module")
+def worker():
+    return FakeWorker()
 
 
-def test_build_model_list_toggles_reasoning_models():
-    mod = load_sidecar_module()
-    base = mod.build_model_list(False)
-    expanded = mod.build_model_list(True)
-    assert "gpt-5-high" not in base
-    assert "gpt-5-high" in expanded
-    assert len(expanded) > len(base)
+@pytest.fixture(scope="class")
+def client(sidecar_mod, worker):
+    app = sidecar_mod.create_app(worker, expose_reasoning_models=True, traffic_max_entries=50)
+    # Entering the client context once keeps the same context stack across
+    # every request the class makes, instead of rebuilding it per call.
+    with app.test_client() as test_client:
+        yield test_client
+
+
+class TestCreateApp:
+    """App/endpoint tests sharing one Flask app instead of rebuilding it per test."""
+
+    @pytest.fixture(autouse=True)
+    def _reset(self, worker, client):
+        worker.error = None
+        worker.submitted.clear()
+        yield
+        client.delete("/debug/traffic")
+
+    def test_chat_completion_success_and_traffic_capture(self, client):
+        resp = client.post("/v1/chat/completions", data=PAYLOAD_HELLO, content_type="application/json")
+        assert resp.status_code == 200
+        data = resp.get_json()
+        assert "_debug" not in data
+        assert data["choices"][0]["message"]["content"] == "ok"
+
+        traffic = client.get("/debug/traffic?limit=20")
+        assert traffic.status_code == 200
+        paths = {row["path"] for row in traffic.get_json()["data"]}
+        assert "/v1/chat/completions" in paths
+
+    def test_rejects_invalid_payload_and_handles_worker_error(self, client, worker):
+        worker.error = RuntimeError("boom")
+
+        bad = client.post("/v1/chat/completions", data="{bad", content_type="application/json")
+        assert bad.status_code == 400
+
+        missing_content = client.post("/v1/chat/completions", data=PAYLOAD_ASSISTANT_ONLY, content_type="application/json")
+        assert missing_content.status_code == 400
+
+        worker_fail = client.post("/v1/chat/completions", data=PAYLOAD_RUN, content_type="application/json")
+        assert worker_fail.status_code == 502
+        assert "Worker failure" in worker_fail.get_json()["error"]["message"]
+
+    def test_models_and_health_and_clear_traffic(self, client):
+        health = client.get("/health")
+        assert health.status_code == 200
+        assert health.get_json()["status"] == "ok"
 
+        models = client.get("/v1/models")
+        assert models.status_code == 200
+        ids = [entry["id"] for entry in models.get_json()["data"]]
+        assert "gpt-5-high" in ids
 
-def test_create_app_chat_completion_success_and_traffic_capture():
-    mod = load_sidecar_module()
-    worker = FakeWorker()
-    app = mod.create_app(worker, expose_reasoning_models=True, traffic_max_entries=50)
-    client = app.test_client()
-
-    payload = {
-        "model": "gpt-5-high",
-        "messages": [{"role": "user", "content": "hello"}],
-    }
-    resp = client.post("/v1/chat/completions", json=payload)
-    assert resp.status_code == 200
-    data = resp.get_json()
-    assert "_debug" not in data
-    assert data["choices"][0]["message"]["content"] == "ok"
-
-    traffic = client.get("/debug/traffic?limit=20")
-    assert traffic.status_code == 200
-    rows = traffic.get_json()["data"]
-    assert any(row["path"] == "/v1/chat/completions" for row in rows)
-
-
-def test_create_app_rejects_invalid_payload_and_handles_worker_error():
-    mod = load_sidecar_module()
-    app = mod.create_app(FakeWorker(error=RuntimeError("boom")), expose_reasoning_models=True, traffic_max_entries=50)
-    client = app.test_client()
-
-    bad = client.post("/v1/chat/completions", data="{bad", content_type="application/json")
-    assert bad.status_code == 400
-
-    missing_content = client.post("/v1/chat/completions", json={"messages": [{"role": "assistant", "content": "x"}]})
-    assert missing_content.status_code == 400
-
-    worker_fail = client.post("/v1/chat/completions", json={"messages": [{"role": "user", "content": "run"}]})
-    assert worker_fail.status_code == 502
-    assert "Worker failure" in worker_fail.get_json()["error"]["message"]
-
-
-def test_create_app_models_and_health_and_clear_traffic():
-    mod = load_sidecar_module()
-    app = mod.create_app(FakeWorker(), expose_reasoning_models=True, traffic_max_entries=50)
-    client = app.test_client()
-
-    health = client.get("/health")
-    assert health.status_code == 200
-    assert health.get_json()["status"] == "ok"
-
-    models = client.get("/v1/models")
-    assert models.status_code == 200
-    ids = [entry["id"] for entry in models.get_json()["data"]]
-    assert "gpt-5-high" in ids
-
-    client.post("/v1/chat/completions", json={"messages": [{"role": "user", "content": "x"}]})
-    traffic_before_clear = client.get("/debug/traffic?limit=100").get_json()["data"]
-    assert not any(row["path"] == "/health" for row in traffic_before_clear)
-    clear_resp = client.delete("/debug/traffic")
-    assert clear_resp.status_code == 200
-    assert clear_resp.get_json()["ok"] is True
+        client.post("/v1/chat/completions", data=PAYLOAD_X, content_type="application/json")
+        paths_before_clear = {row["path"] for row in client.get("/debug/traffic?limit=100").get_json()["data"]}
+        assert "/health" not in paths_before_clear
+        clear_resp = client.delete("/debug/traffic")
+        assert clear_resp.status_code == 200
+        assert clear_resp.get_json()["ok"] is True
@@ -1,34 +1,50 @@
+import collections
+import concurrent.futures
 import threading
-import time
+
+import pytest
 
 from chatmock.request_queue import FifoRequestGate
 
 
-def test_fifo_request_gate_processes_waiters_in_submission_order():
+@pytest.fixture(scope="module")
+def pool():
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=10)
+    yield executor
+    executor.shutdown()
+
+
+@pytest.mark.parametrize("worker_count", [2, pytest.param(10, marks=pytest.mark.slow)])
+def test_fifo_request_gate_processes_waiters_in_submission_order(pool, worker_count):
     gate = FifoRequestGate(enabled=True)
     first_lease = gate.acquire()
-    observed = []
-    threads = []
+    # Each queued acquire() signals the semaphore, so the main thread only
+    # starts the next worker once the previous one holds its ticket —
+    # explicit happens-before instead of sleep-based ordering.
+    enqueued = threading.Semaphore(0)
+    gate._on_enqueue = lambda ticket: enqueued.release()
+    # deque.append is GIL-atomic and never triggers a list resize under the
+    # concurrent appends.
+    observed = collections.deque()
+    futures = []
 
     def worker(index):
         lease = gate.acquire()
         observed.append(index)
-        time.sleep(0.01)
         lease.release()
 
-    for i in range(10):
-        t = threading.Thread(target=worker, args=(i,))
-        threads.append(t)
-        t.start()
-        time.sleep(0.003)
+    for i in range(worker_count):
+        futures.append(pool.submit(worker, i))
+        assert enqueued.acquire(timeout=2)
 
     first_lease.release()
 
-    for t in threads:
-        t.join(timeout=2)
-        assert not t.is_alive()
+    done, not_done = concurrent.futures.wait(futures, timeout=2)
+    assert not not_done
+    for future in done:
+        future.result()
 
-    assert observed == list(range(10))
+    assert list(observed) == list(range(worker_count))
     snapshot = gate.snapshot()
     assert snapshot["active"] is False
     assert snapshot["waiting"] == 0